@@ -0,0 +1,202 @@
+import os
+import re
+import json
+import sqlite3
+import hashlib
+
+DEFAULT_CATALOGUE_PATH = "catalogue.db"
+
+# Directory names used by earlier versions for the per-table summary files
+LEGACY_SUMMARY_DIRS = ("LLM_Summaries", "LLM_summaries")
+LEGACY_DB_NAMES_FILE = "schema_details/db_names.txt"
+
+# PRAGMA user_version value recorded once the legacy text files have been imported
+LEGACY_IMPORTED_VERSION = 1
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS tables (
+    table_name  TEXT PRIMARY KEY,
+    schema_name TEXT,
+    summary     TEXT,
+    fingerprint TEXT,
+    profile     TEXT,
+    updated_at  TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS table_tags (
+    table_name TEXT NOT NULL REFERENCES tables(table_name) ON DELETE CASCADE,
+    tag        TEXT NOT NULL,
+    PRIMARY KEY (table_name, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_table_tags_tag ON table_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_tables_schema ON tables(schema_name);
+"""
+
+
+def parse_tags(summary):
+    """Extract the 'Table Tags: Tag1, Tag2, Tag3' line produced by the catalogue prompt."""
+    if not summary:
+        return []
+    match = re.search(r"Table Tags:\s*(.+)", summary)
+    if not match:
+        return []
+    return [tag.strip().strip('*.').strip() for tag in match.group(1).split(',') if tag.strip().strip('*.').strip()]
+
+
+def compute_fingerprint(schema_name, columns, relationships):
+    """Hash the structural details of a table so unchanged tables can be detected."""
+    payload = json.dumps([schema_name, list(columns or []), relationships or ""])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CatalogueStore:
+    """Single-file sqlite store for table summaries, tags, schemas, fingerprints and profiles."""
+
+    def __init__(self, path=DEFAULT_CATALOGUE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA_SQL)
+
+    def close(self):
+        self.connection.close()
+
+    def is_empty(self):
+        return self.connection.execute("SELECT 1 FROM tables LIMIT 1").fetchone() is None
+
+    def needs_legacy_import(self):
+        """True for a fresh store that has never imported the legacy text files."""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        return version < LEGACY_IMPORTED_VERSION and self.is_empty()
+
+    def table_names(self):
+        """Return all catalogued table names without reading their summaries."""
+        rows = self.connection.execute("SELECT table_name FROM tables ORDER BY table_name")
+        return [row["table_name"] for row in rows]
+
+    def get_schema_mapping(self):
+        """Return a {table_name: schema_name} mapping."""
+        rows = self.connection.execute("SELECT table_name, schema_name FROM tables WHERE schema_name IS NOT NULL")
+        return {row["table_name"]: row["schema_name"] for row in rows}
+
+    def get_summary(self, table_name):
+        """Read the summary of a single table."""
+        row = self.connection.execute("SELECT summary FROM tables WHERE table_name = ?", (table_name,)).fetchone()
+        return row["summary"] if row else None
+
+    def iter_summaries(self):
+        """Yield (table_name, schema_name, summary) one row at a time."""
+        cursor = self.connection.execute(
+            "SELECT table_name, schema_name, summary FROM tables WHERE summary IS NOT NULL ORDER BY table_name"
+        )
+        for row in cursor:
+            yield row["table_name"], row["schema_name"], row["summary"]
+
+    def get_fingerprint(self, table_name):
+        row = self.connection.execute("SELECT fingerprint FROM tables WHERE table_name = ?", (table_name,)).fetchone()
+        return row["fingerprint"] if row else None
+
+    def get_profile(self, table_name):
+        row = self.connection.execute("SELECT profile FROM tables WHERE table_name = ?", (table_name,)).fetchone()
+        if row is None or row["profile"] is None:
+            return None
+        return json.loads(row["profile"])
+
+    def get_tags(self, table_name):
+        rows = self.connection.execute("SELECT tag FROM table_tags WHERE table_name = ? ORDER BY tag", (table_name,))
+        return [row["tag"] for row in rows]
+
+    def find_tables_by_tag(self, tag):
+        """Look up tables by tag (case-insensitive) using the tag index."""
+        rows = self.connection.execute(
+            "SELECT table_name FROM table_tags WHERE tag = ? COLLATE NOCASE ORDER BY table_name", (tag,)
+        )
+        return [row["table_name"] for row in rows]
+
+    def upsert_table(self, table_name, schema_name=None, summary=None, tags=None, fingerprint=None, profile=None):
+        """Insert or replace a table entry and its tags in a single transaction."""
+        with self.connection:
+            self._write_table(table_name, schema_name, summary, tags, fingerprint, profile)
+
+    def _write_table(self, table_name, schema_name=None, summary=None, tags=None, fingerprint=None, profile=None):
+        # Fields passed as None keep their stored value; callers own the transaction
+        replace_tags = summary is not None or tags is not None
+        if tags is None:
+            tags = parse_tags(summary)
+        profile_json = json.dumps(profile) if profile is not None else None
+        self.connection.execute(
+            """
+            INSERT INTO tables (table_name, schema_name, summary, fingerprint, profile, updated_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(table_name) DO UPDATE SET
+                schema_name = COALESCE(excluded.schema_name, tables.schema_name),
+                summary     = COALESCE(excluded.summary, tables.summary),
+                fingerprint = COALESCE(excluded.fingerprint, tables.fingerprint),
+                profile     = COALESCE(excluded.profile, tables.profile),
+                updated_at  = CURRENT_TIMESTAMP
+            """,
+            (table_name, schema_name, summary, fingerprint, profile_json),
+        )
+        if replace_tags:
+            # A regenerated summary without a tag line must not keep the old tags
+            self.connection.execute("DELETE FROM table_tags WHERE table_name = ?", (table_name,))
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO table_tags (table_name, tag) VALUES (?, ?)",
+                [(table_name, tag) for tag in tags],
+            )
+
+    def delete_missing(self, table_names):
+        """Remove tables that are not in table_names; their tags go with them via ON DELETE CASCADE."""
+        missing = set(self.table_names()) - set(table_names)
+        with self.connection:
+            self.connection.executemany("DELETE FROM tables WHERE table_name = ?", [(name,) for name in missing])
+        return len(missing)
+
+    def import_text_files(self, summaries_dir=None, db_names_file=LEGACY_DB_NAMES_FILE):
+        """Import the legacy <table>_summary.txt files and db_names.txt into the store."""
+        if summaries_dir is None:
+            summaries_dir = next((d for d in LEGACY_SUMMARY_DIRS if os.path.isdir(d)), None)
+
+        table_schemas = {}
+        if db_names_file and os.path.exists(db_names_file):
+            with open(db_names_file, 'r') as file:
+                for line in file:
+                    parts = line.split(':')
+                    if len(parts) == 2:
+                        table_schemas[parts[0].strip()] = parts[1].strip()
+
+        summaries = {}
+        if summaries_dir and os.path.isdir(summaries_dir):
+            for filename in os.listdir(summaries_dir):
+                if filename.endswith('_summary.txt'):
+                    table_name = filename.replace('_summary.txt', '')
+                    with open(os.path.join(summaries_dir, filename), 'r') as file:
+                        summaries[table_name] = file.read()
+
+        # Write everything in one transaction so a partial import is never visible
+        with self.connection:
+            for table_name in sorted(set(table_schemas) | set(summaries)):
+                self._write_table(table_name, table_schemas.get(table_name), summaries.get(table_name))
+            # Recorded even when nothing was found, so the legacy directories are only scanned once
+            self.connection.execute(f"PRAGMA user_version = {LEGACY_IMPORTED_VERSION}")
+
+        imported = len(set(table_schemas) | set(summaries))
+        if imported > 0:
+            print(f"Imported {imported} tables into catalogue store {self.path}.")
+        return imported
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Usage: python -m Agents.catalogue_store [catalogue.db] [summaries_dir] [db_names_file]
+    args = sys.argv[1:]
+    store = CatalogueStore(args[0] if len(args) > 0 else DEFAULT_CATALOGUE_PATH)
+    store.import_text_files(
+        args[1] if len(args) > 1 else None,
+        args[2] if len(args) > 2 else LEGACY_DB_NAMES_FILE,
+    )
+    store.close()
@@ -1,17 +1,17 @@
 import pyodbc
-import os
 from openai import AsyncOpenAI
 from openai import OpenAI
 import config
 import asyncio
 from semantic_kernel.functions import kernel_function
+from Agents.catalogue_store import CatalogueStore, DEFAULT_CATALOGUE_PATH, compute_fingerprint
 
 class DataCatalogueAgent:
     def __init__(self, connection):
         self.connection = connection
 
     @kernel_function
-    async def get_table_summaries(self, output_dir="LLM_summaries"):
+    async def get_table_summaries(self, catalogue_path=DEFAULT_CATALOGUE_PATH):
         try:
             cursor = self.connection.cursor()
             
@@ -19,51 +19,75 @@ class DataCatalogueAgent:
             cursor.execute("SELECT TABLE_SCHEMA, TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE='BASE TABLE'")
             tables = cursor.fetchall()
 
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
+            store = CatalogueStore(catalogue_path)
 
             summaries = {}
             total_tables = len(tables)
             processed_tables = 0
+            skipped_tables = 0
             failed_tables = 0
 
-            # For each table, retrieve schema details, relationships, and top 20 rows
-            for table in tables:
-                schema_name = table.TABLE_SCHEMA
-                table_name = table.TABLE_NAME
-                full_table_name = f"{table_name}"
-
-                print(f"Processing table: {full_table_name}...")
-
-                try:
-                    # Get column details and skip unsupported types
-                    column_details = self.get_column_details(table_name, schema_name)
-
-                    # Get foreign key/primary key relationships
-                    relationship_summary = self.get_table_relationship_output(table_name, schema_name)
-
-                    # Get top 20 rows for supported columns
-                    top_rows = self.get_top_rows(table_name, schema_name, column_details['supported_columns'])
-
-                    # Combine all information into a prompt for GPT-4
-                    prompt = self.generate_llm_prompt(full_table_name, column_details['supported_columns'], relationship_summary, top_rows)
-
-                    # Generate a human-readable summary using GPT-4
-                    summary = await self.generate_llm_summary(prompt)
-
-                    # Save the summary to a file
-                    summary_file_path = os.path.join(output_dir, f"{table_name}_summary.txt")
-                    with open(summary_file_path, 'w') as file:
-                        file.write(summary)
-
-                    summaries[table_name] = summary
-                    processed_tables += 1
-
-                except Exception as e:
-                    print(f"Error processing table {full_table_name}: {e}")
-                    failed_tables += 1
+            try:
+                # For each table, retrieve schema details, relationships, and top 20 rows
+                for table in tables:
+                    schema_name = table.TABLE_SCHEMA
+                    table_name = table.TABLE_NAME
+                    full_table_name = f"{table_name}"
+
+                    print(f"Processing table: {full_table_name}...")
+
+                    try:
+                        # Get column details and skip unsupported types
+                        column_details = self.get_column_details(table_name, schema_name)
+
+                        # Get foreign key/primary key relationships
+                        relationship_summary = self.get_table_relationship_output(table_name, schema_name)
+
+                        # Skip tables whose structure has not changed since the last run
+                        fingerprint = compute_fingerprint(schema_name, column_details['supported_columns'], relationship_summary)
+                        cached_summary = store.get_summary(table_name)
+                        if cached_summary and fingerprint == store.get_fingerprint(table_name):
+                            summaries[table_name] = cached_summary
+                            skipped_tables += 1
+                            continue
+
+                        # Get top 20 rows for supported columns
+                        top_rows = self.get_top_rows(table_name, schema_name, column_details['supported_columns'])
+
+                        # Combine all information into a prompt for GPT-4
+                        prompt = self.generate_llm_prompt(full_table_name, column_details['supported_columns'], relationship_summary, top_rows)
+
+                        # Generate a human-readable summary using GPT-4
+                        summary = await self.generate_llm_summary(prompt)
+                        if summary == "Error generating summary.":
+                            raise Exception(summary)
+
+                        # Save the summary, schema, fingerprint and profile atomically in the catalogue store
+                        store.upsert_table(
+                            table_name,
+                            schema_name=schema_name,
+                            summary=summary,
+                            fingerprint=fingerprint,
+                            profile=column_details,
+                        )
+
+                        summaries[table_name] = summary
+                        processed_tables += 1
+
+                    except Exception as e:
+                        print(f"Error processing table {full_table_name}: {e}")
+                        failed_tables += 1
+
+                # Drop tables that no longer exist so they stop appearing in SQL-generation prompts
+                removed_tables = store.delete_missing([table.TABLE_NAME for table in tables])
+            finally:
+                store.close()
 
             print(f"Processing complete: {processed_tables}/{total_tables} tables processed successfully.")
+            if removed_tables > 0:
+                print(f"{removed_tables} dropped tables removed from the catalogue store.")
+            if skipped_tables > 0:
+                print(f"{skipped_tables} unchanged tables reused from the catalogue store.")
             if failed_tables > 0:
                 print(f"{failed_tables} tables failed to process.")
             return summaries
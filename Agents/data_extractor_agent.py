@@ -1,16 +1,76 @@
-import pyodbc
-import pandas as pd
+import os
 import re
+import json
 from semantic_kernel.functions import kernel_function
 
+DEFAULT_SCHEMA_CACHE_PATH = "schema_cache.json"
+
+# Schema mappings already checked against the database in this process, keyed by cache path.
+# setup_agents builds a new DataExtractorAgent for every query, so later turns reuse these directly.
+_validated_schemas = {}
+
 class DataExtractorAgent:
-    def __init__(self, connection):
+    def __init__(self, connection, schema_cache_path=DEFAULT_SCHEMA_CACHE_PATH):
         self.connection = connection
+        self.schema_cache_path = schema_cache_path
+        self.cached_signature = None
+        self.schema_validated = False
         self.table_schemas = self.get_table_schemas()
 
+    def get_schema_signature(self):
+        """Cheap check of the table catalogue: server, database, table count and latest modification date."""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT @@SERVERNAME, DB_NAME(), COUNT(*), MAX(modify_date) FROM sys.tables")
+        server_name, db_name, count, last_modified = cursor.fetchone()
+        return [server_name, db_name, count, str(last_modified)]
+
+    def load_schema_cache(self):
+        """Read the warm-start snapshot written by a previous run, if any."""
+        if not self.schema_cache_path or not os.path.exists(self.schema_cache_path):
+            return None
+        try:
+            with open(self.schema_cache_path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable schema cache: {e}")
+            return None
+
+    def save_schema_cache(self, signature, schema_mapping):
+        """Snapshot the schema mapping so the next start can skip discovery."""
+        if not self.schema_cache_path:
+            return
+        try:
+            # Write to a temporary file first so a crash never leaves a truncated cache
+            tmp_path = f"{self.schema_cache_path}.tmp"
+            with open(tmp_path, 'w') as file:
+                json.dump({'signature': signature, 'schemas': schema_mapping}, file)
+            os.replace(tmp_path, self.schema_cache_path)
+        except OSError as e:
+            print(f"Error saving schema cache: {e}")
+
     @kernel_function
     def get_table_schemas(self):
         """Retrieve the schema for each table in the database."""
+        if self.schema_cache_path in _validated_schemas:
+            self.schema_validated = True
+            return _validated_schemas[self.schema_cache_path]
+
+        # Use the snapshot straight away; it is checked against the database on the first execute_query
+        cache = self.load_schema_cache()
+        if cache is not None and cache.get('schemas') is not None:
+            self.cached_signature = cache.get('signature')
+            return cache['schemas']
+
+        return self.discover_table_schemas()
+
+    def discover_table_schemas(self, signature=None):
+        """Query INFORMATION_SCHEMA for every table's schema and refresh the warm-start cache."""
+        if signature is None:
+            try:
+                signature = self.get_schema_signature()
+            except Exception as e:
+                print(f"Error reading schema signature: {e}")
+
         schema_mapping = {}
         cursor = self.connection.cursor()
 
@@ -21,9 +81,30 @@ class DataExtractorAgent:
         # Map each table to its schema
         for table in tables:
             schema_mapping[table.TABLE_NAME] = table.TABLE_SCHEMA
-        
+
+        if signature is not None:
+            self.save_schema_cache(signature, schema_mapping)
+        _validated_schemas[self.schema_cache_path] = schema_mapping
+        self.schema_validated = True
         return schema_mapping
 
+    def validate_schema_cache(self):
+        """Check a snapshot loaded at startup against the database once, rediscovering if it is stale."""
+        if self.schema_validated:
+            return
+        try:
+            signature = self.get_schema_signature()
+        except Exception as e:
+            print(f"Error validating schema cache: {e}")
+            return
+
+        if signature != self.cached_signature:
+            print("Schema cache is out of date, rediscovering table schemas.")
+            self.table_schemas = self.discover_table_schemas(signature)
+        else:
+            _validated_schemas[self.schema_cache_path] = self.table_schemas
+            self.schema_validated = True
+
     @kernel_function
     def clean_query(self, sql_query):
         """Clean the SQL query to remove unwanted characters and add schema prefixes."""
@@ -46,6 +127,9 @@ class DataExtractorAgent:
     def execute_query(self, sql_query):
         """Execute the SQL query on the database and return the results."""
         try:
+            # Make sure the schema prefixes come from the current database
+            self.validate_schema_cache()
+
             # Clean and validate the query before execution
             sql_query = self.clean_query(sql_query)
 
@@ -61,7 +145,8 @@ class DataExtractorAgent:
             # Fetch the column names from the cursor description
             columns = [column[0] for column in cursor.description]
 
-            # Return data in tabular format using pandas
+            # Return data in tabular format using pandas, imported here to keep startup light
+            import pandas as pd
             return pd.DataFrame.from_records(rows, columns=columns)
 
         except Exception as e:
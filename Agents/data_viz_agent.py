@@ -1,7 +1,4 @@
-import openai
 import config
-import pandas as pd
-import matplotlib.pyplot as plt
 from semantic_kernel.functions import kernel_function
 from openai import OpenAI
 
@@ -19,6 +16,8 @@ class DataVizAgent:
         Execute the provided SQL query and return a DataFrame.
         This function will execute the SQL query generated by the SQL Generator Agent.
         """
+        import pandas as pd
+
         # Connect to the DataExtractorAgent to execute the query
         result_df = self.data_extractor_agent.execute_query(sql_query)
         print(type(result_df))
@@ -74,7 +73,11 @@ class DataVizAgent:
         if start_idx != -1 and end_idx != -1:
             plot_code = plot_code[start_idx:end_idx]
         try:
-            exec(plot_code)
+            # Pandas and Matplotlib are only needed once a plot is rendered
+            import pandas as pd
+            import matplotlib.pyplot as plt
+            # Explicit globals so nested scopes in the generated code (lambdas, defs) can see pd and plt
+            exec(plot_code, {"pd": pd, "plt": plt, "df": df, "sql_query": sql_query})
             plt.show()
 
         except Exception as e:
@@ -1,37 +1,29 @@
-import os
+from contextlib import closing
 from openai import AsyncOpenAI
 import config
 from semantic_kernel.functions import kernel_function
+from Agents.catalogue_store import CatalogueStore, DEFAULT_CATALOGUE_PATH, LEGACY_DB_NAMES_FILE
 
 class SQLQueryGeneratorAgent:
-    def __init__(self, summaries_dir="LLM_Summaries", db_names_file="schema_details/db_names.txt"):
-        # Load table summaries from the local directory
-        self.summaries = self.load_summaries(summaries_dir)
-        self.table_schemas = self.load_table_schemas(db_names_file)  # Load table schemas
+    def __init__(self, catalogue_path=DEFAULT_CATALOGUE_PATH, summaries_dir=None, db_names_file=LEGACY_DB_NAMES_FILE):
+        # The store is opened per call and closed again, since setup_agents builds a new agent every query
+        self.catalogue_path = catalogue_path
+        with closing(CatalogueStore(catalogue_path)) as store:
+            if store.needs_legacy_import():
+                # First run after upgrading: migrate the legacy text files into the store
+                store.import_text_files(summaries_dir, db_names_file)
 
     @kernel_function
-    def load_summaries(self, summaries_dir):
-        """Load table summaries from the LLM_Summaries folder."""
-        summaries = {}
-        for filename in os.listdir(summaries_dir):
-            if filename.endswith('_summary.txt'):
-                table_name = filename.replace('_summary.txt', '')
-                with open(os.path.join(summaries_dir, filename), 'r') as file:
-                    summaries[table_name] = file.read()
-        return summaries
+    def load_summaries(self):
+        """Load table summaries from the catalogue store."""
+        with closing(CatalogueStore(self.catalogue_path)) as store:
+            return {table: summary for table, _, summary in store.iter_summaries()}
 
     @kernel_function
-    def load_table_schemas(self, db_names_file):
-        """Load table names and schemas from the provided file."""
-        table_schemas = {}
-        with open(db_names_file, 'r') as file:
-            for line in file:
-                parts = line.split(':')
-                if len(parts) == 2:
-                    table_name = parts[0].strip()
-                    schema_name = parts[1].strip()
-                    table_schemas[table_name] = schema_name
-        return table_schemas
+    def load_table_schemas(self):
+        """Load table names and schemas from the catalogue store."""
+        with closing(CatalogueStore(self.catalogue_path)) as store:
+            return store.get_schema_mapping()
 
     @kernel_function
     async def generate_sql_query(self, user_query):
@@ -46,7 +38,8 @@ class SQLQueryGeneratorAgent:
     @kernel_function
     def construct_prompt(self, user_query):
         """Construct a detailed prompt for LLM based on user query and table summaries."""
-        summary_text = "\n\n".join([f"Table: {self.table_schemas[table]}\n{summary}" for table, summary in self.summaries.items() if table in self.table_schemas])
+        with closing(CatalogueStore(self.catalogue_path)) as store:
+            summary_text = "\n\n".join([f"Table: {schema}\n{summary}" for _, schema, summary in store.iter_summaries() if schema])
         
         prompt = f"""
         The user has asked the following question: '{user_query}'.
@@ -1,10 +1,25 @@
 import asyncio
-from setup_agents_and_plugins import setup_agents
-from semantic_kernel.contents.chat_message_content import ChatMessageContent
-from semantic_kernel.contents.utils.author_role import AuthorRole
+import importlib
+import threading
+
+def warm_imports():
+    """Import the agent stack in the background while the user types the first query."""
+    try:
+        importlib.import_module("setup_agents_and_plugins")
+    except Exception:
+        # load_agent_stack imports it again on the main thread, which reports the error once
+        pass
+
+def load_agent_stack():
+    """Return the agent setup entry point and message types, waiting for warm_imports if it is still running."""
+    from setup_agents_and_plugins import setup_agents
+    from semantic_kernel.contents.chat_message_content import ChatMessageContent
+    from semantic_kernel.contents.utils.author_role import AuthorRole
+    return setup_agents, ChatMessageContent, AuthorRole
 
 async def main():
     print("Welcome to the AI Assistant! Type 'exit' to quit.")
+    threading.Thread(target=warm_imports, daemon=True).start()
     
     while True:
         user_input = input("Your query: ")
@@ -13,6 +28,8 @@ async def main():
             print("Exiting the assistant. Goodbye!")
             break
 
+        setup_agents, ChatMessageContent, AuthorRole = load_agent_stack()
+
         # Set up agents and plugins after capturing user input
         agent_group_chat, agents = await setup_agents(user_input)
 
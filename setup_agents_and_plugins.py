@@ -24,11 +24,14 @@ async def setup_agents(user_input):
     # Establish the database connection
     connection = get_db_connection()
 
+    # Share one DataExtractorAgent so schema discovery runs only once
+    data_extractor = DataExtractorAgent(connection)
+
     # Add plugins to the kernel
     kernel.add_plugin(DataCatalogueAgent(connection), plugin_name="DataCatalogue")
-    kernel.add_plugin(DataExtractorAgent(connection), plugin_name="DataExtractor")
+    kernel.add_plugin(data_extractor, plugin_name="DataExtractor")
     kernel.add_plugin(SQLQueryGeneratorAgent(), plugin_name="SQLQueryGenerator")
-    kernel.add_plugin(DataVizAgent(DataExtractorAgent(connection)), plugin_name="DataViz")
+    kernel.add_plugin(DataVizAgent(data_extractor), plugin_name="DataViz")
 
     # Add services to the kernel
     kernel.add_service(OpenAIChatCompletion(ai_model_id= "gpt-4o", service_id=CATALOG, api_key=config.OPENAI_API_KEY))
@@ -0,0 +1,60 @@
+import sys
+import subprocess
+from collections import defaultdict
+
+# Usage: python startup_profile.py [module] [top_n]
+# Prints an import-time breakdown for the given module (default: setup_agents_and_plugins).
+
+def parse_importtime(stderr):
+    """Parse `-X importtime` output into (depth, self_us, cumulative_us, name) tuples."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Each nesting level adds two spaces after the single separator space
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return entries
+
+
+def profile_imports(module="setup_agents_and_plugins"):
+    """Run `python -X importtime` on the module and return (package, microseconds) pairs.
+
+    Every module imported on behalf of the target contributes its self time to its top-level
+    package, so the rows add up to the total without counting any import twice.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        # Show the import error but still report what loaded before it
+        print(result.stderr.splitlines()[-1] if result.stderr else "Import failed.")
+
+    # importtime prints children before their parent, so the target's subtree is every line
+    # after the previous top-level line up to and including the target's own line
+    subtree = []
+    for depth, self_us, _, name in parse_importtime(result.stderr):
+        subtree.append((name, self_us))
+        if depth == 0:
+            if name == module:
+                break
+            subtree = []
+
+    totals = defaultdict(int)
+    for name, self_us in subtree:
+        totals[name.split(".")[0]] += self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+if __name__ == "__main__":
+    module = sys.argv[1] if len(sys.argv) > 1 else "setup_agents_and_plugins"
+    top_n = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    breakdown = profile_imports(module)
+    total = sum(us for _, us in breakdown)
+    print(f"Import-time breakdown for {module} (total {total / 1000:.1f} ms):")
+    for package, us in breakdown[:top_n]:
+        print(f"  {package:<30} {us / 1000:>10.1f} ms  {100 * us / total if total else 0:5.1f}%")